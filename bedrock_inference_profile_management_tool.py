@@ -1,11 +1,65 @@
 import argparse
-import boto3
-import csv
-import os
-import yaml
-from bedrock_tagger import BedrockTagger
-from datetime import datetime
-from getpass import getpass
+import logging
+import sys
+import time
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
+from logging.handlers import MemoryHandler
+from typing import TYPE_CHECKING, Callable
+from cachetools import TTLCache
+
+# boto3, yaml and BedrockTagger are imported inside the functions that use
+# them, so that --help and argument errors don't pay their import cost.
+if TYPE_CHECKING:
+    import boto3
+    import botocore.config
+    from bedrock_tagger import BedrockTagger
+
+# Progress output of the batch modes, interactive modes print directly
+log = logging.getLogger('bedrock_ipm')
+
+# Results of the Bedrock list APIs, reused across prompts in a session
+_list_cache = TTLCache(maxsize=32, ttl=600)
+# Entering this at the model keyword prompt drops all cached results
+REFRESH_KEYWORD = '!refresh'
+
+def configure_batch_logging():
+    """
+    Send batch progress messages to stdout through a memory buffer.
+
+    Messages are written in chunks of up to 1024 records, immediately on
+    an error, and when the interpreter exits.
+    """
+    stream_handler = logging.StreamHandler(sys.stdout)
+    stream_handler.setFormatter(logging.Formatter('%(message)s'))
+    log.addHandler(MemoryHandler(1024, flushLevel=logging.ERROR, target=stream_handler))
+    log.setLevel(logging.INFO)
+    log.propagate = False
+
+def _positive_int(value: str) -> int:
+    """argparse type for options that need a count of at least 1"""
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {number}")
+    return number
+
+def _cmd_create(args: argparse.Namespace):
+    """Create inference profiles interactively, or in batch from a yaml file"""
+    if args.file:
+        configure_batch_logging()
+        batch_create_inference_profiles(args.file, args.max_workers)
+    else:
+        interactive_create_inference_profile()
+
+def _cmd_list(args: argparse.Namespace):
+    """List Application inference profiles and optionally delete them"""
+    interactive_list_inference_profile()
+
+def _cmd_tag(args: argparse.Namespace):
+    """Batch tag existing inference profiles from a yaml file"""
+    configure_batch_logging()
+    batch_tag_inference_profiles(args.file, args.max_workers)
 
 def parse_arguments() -> argparse.Namespace:
     """Parse command line arguments"""
@@ -16,15 +70,19 @@ def parse_arguments() -> argparse.Namespace:
 Examples:
   # Create a new inference profile (interactive mode)
   python3 bedrock_inference_profile_management_tool.py
+  python3 bedrock_inference_profile_management_tool.py create
   
   # List and manage existing inference profiles
-  python3 bedrock_inference_profile_management_tool.py -l
+  python3 bedrock_inference_profile_management_tool.py list
 
   # Batch create inference profiles from a yaml file
-  python3 bedrock_inference_profile_management_tool.py -f ./bedrock-profiles.yaml
+  python3 bedrock_inference_profile_management_tool.py create -f ./bedrock-profiles.yaml
   
   # Batch tag existing inference profiles from a yaml file
-  python3 bedrock_inference_profile_management_tool.py -t ./bedrock-profiles.yaml
+  python3 bedrock_inference_profile_management_tool.py tag ./bedrock-profiles.yaml
+
+  # Batch create with 16 profiles processed concurrently
+  python3 bedrock_inference_profile_management_tool.py create -f ./bedrock-profiles.yaml --max-workers 16
   
 Operations:
   - Create new inference profiles with tags
@@ -35,33 +93,79 @@ Operations:
   - Support both Foundation Models and Inference Profiles(including Cross-region Inference Profiles)
   - Export profile information to CSV
         """)
-    
-    parser.add_argument(
-        '-l', '--list',
-        action='store_true',
-        help='List all Application inference profiles and provide option to delete'
+    # Without a command the tool starts interactive creation
+    parser.set_defaults(func=_cmd_create, file=None, max_workers=None)
+
+    # Shared by the commands that can run in batch mode
+    batch_options = argparse.ArgumentParser(add_help=False)
+    batch_options.add_argument(
+        '--max-workers',
+        type=_positive_int,
+        help='Number of profiles processed concurrently in batch mode (default: 8)'
     )
-    parser.add_argument(
+
+    subparsers = parser.add_subparsers(dest='cmd', title='commands')
+
+    create_parser = subparsers.add_parser(
+        'create',
+        parents=[batch_options],
+        help='Create inference profiles interactively, or in batch with -f'
+    )
+    create_parser.add_argument(
         '-f', '--file',
         type=str,
         help='Path to a yaml file for batch creation'
     )
-    parser.add_argument(
-        '-t', '--tag',
+    create_parser.set_defaults(func=_cmd_create)
+
+    list_parser = subparsers.add_parser(
+        'list',
+        help='List all Application inference profiles and provide option to delete'
+    )
+    list_parser.set_defaults(func=_cmd_list)
+
+    tag_parser = subparsers.add_parser(
+        'tag',
+        parents=[batch_options],
+        help='Batch tag existing profiles from a yaml file'
+    )
+    tag_parser.add_argument(
+        'file',
         type=str,
         help='Path to a yaml file for batch tagging existing profiles'
     )
+    tag_parser.set_defaults(func=_cmd_tag)
     
-    return parser.parse_args()
+    args = parser.parse_args()
+    if args.max_workers is None:
+        args.max_workers = 8
+    # Interactive creation handles one profile at a time
+    elif args.func is _cmd_create and not args.file:
+        create_parser.error("--max-workers requires -f/--file")
+    return args
+
+def initBoto3Session(max_workers: int = 1) -> "tuple[boto3.Session, botocore.config.Config]":
+    """
+    Select AWS credentials and build the client config shared by all Bedrock calls.
+
+    Args:
+        max_workers: number of threads that will share the client
+
+    Returns:
+        tuple of the boto3.Session and a botocore Config with adaptive
+        retries and a connection pool large enough for the batch workers
+    """
+    import boto3
+    from botocore.config import Config
 
-def initBoto3Session() -> boto3.Session:
     session = boto3.Session()
     credentials = session.get_credentials()
-    services = session.get_available_services()
     profiles = session.available_profiles
 
     # Get AWS Credential
-    if credentials and 'bedrock' in services:
+    # Only the presence of credentials matters here; listing the available
+    # services just to look for 'bedrock' scans botocore's data directory.
+    if credentials is not None:
         # Use AWS Credential from the Profile
         if profiles:
             print("\n=== Choose AWS Credential Profile ===")
@@ -82,11 +186,17 @@ def initBoto3Session() -> boto3.Session:
         sk = get_user_input("Enter AWS Secret Access Key (hidden)", is_secret=True)
         session = boto3.Session(aws_access_key_id=ak, aws_secret_access_key=sk)
 
-    return session
+    config = Config(
+        retries={'mode': 'adaptive', 'max_attempts': 10},
+        # One connection per worker thread, never below botocore's default of 10
+        max_pool_connections=max(max_workers, 10)
+    )
+    return session, config
 
 def get_user_input(prompt: str, default: str = None, is_secret: bool = False) -> str:
     """Get user input and support the default value."""
     if is_secret:
+        from getpass import getpass
         return getpass(f"{prompt}: ").strip()
     if default:
         user_input = input(f"{prompt} [{default}]: ").strip()
@@ -111,14 +221,29 @@ def display_models(models: list):
         print("No models found.")
         return
         
-    print("\n=== Available Models ===")
-    print(f"Found {len(models)} models:")
+    # Build the whole listing and write it at once rather than print per line
+    parts = ["\n=== Available Models ===\n", f"Found {len(models)} models:\n"]
     for idx, model in enumerate(models):
-        print(f"\n{idx}. Model ID: {model['modelId']}")
-        print(f"   Provider: {model['providerName']}")
-        print(f"   Name: {model['modelName']}")
+        parts.append(f"\n{idx}. Model ID: {model['modelId']}\n")
+        parts.append(f"   Provider: {model['providerName']}\n")
+        parts.append(f"   Name: {model['modelName']}\n")
+    sys.stdout.write("".join(parts))
+
+def cached_list(key: tuple, fetch) -> list:
+    """
+    Return the cached result for key, calling fetch() on a miss.
 
-def get_valid_models(bedrock_tagger: BedrockTagger) -> list:
+    Empty results are not cached, since callers retry on them.
+    """
+    result = _list_cache.get(key)
+    if result is not None:
+        return result
+    result = fetch()
+    if result:
+        _list_cache[key] = result
+    return result
+
+def get_valid_models(bedrock_tagger: "BedrockTagger") -> list:
     """
     Keep asking for keyword until we get some models to display
     
@@ -133,7 +258,14 @@ def get_valid_models(bedrock_tagger: BedrockTagger) -> list:
         if not keyword:
             print("Please enter a valid keyword.")
             continue
-        models = bedrock_tagger.list_available_models(keyword)
+        if keyword == REFRESH_KEYWORD:
+            _list_cache.clear()
+            print("Cached model and profile lists cleared.")
+            continue
+        models = cached_list(
+            ('models', bedrock_tagger.region_name, keyword),
+            lambda: bedrock_tagger.list_available_models(keyword)
+        )
         
         if models:
             display_models(models)
@@ -147,24 +279,25 @@ def display_inference_profiles(profiles: list):
         print("No inference profiles found.")
         return
         
-    print("\n=== Available Inference Profiles ===")
-    print(f"Found {len(profiles)} profiles:")
+    # Build the whole listing and write it at once rather than print per line
+    parts = ["\n=== Available Inference Profiles ===\n", f"Found {len(profiles)} profiles:\n"]
     for idx, profile in enumerate(profiles):
-        print(f"\n{idx}. Profile Name: {profile['name']}")
-        print(f"   Region: {profile['region']}")
-        print(f"   Model ID: {profile['modelId']}")
+        parts.append(f"\n{idx}. Profile Name: {profile['name']}\n")
+        parts.append(f"   Region: {profile['region']}\n")
+        parts.append(f"   Model ID: {profile['modelId']}\n")
         if profile['modelArn']:
-            print("   Model ARNs:")
+            parts.append("   Model ARNs:\n")
             for model in profile['modelArn']:
-                print(f"     - {model}")
-        print(f"   Status: {profile['status']}")
-        print(f"   ARN: {profile['inferenceProfileArn']}")
+                parts.append(f"     - {model}\n")
+        parts.append(f"   Status: {profile['status']}\n")
+        parts.append(f"   ARN: {profile['inferenceProfileArn']}\n")
         if profile['tags']:
-            print("   Tags:")
+            parts.append("   Tags:\n")
             for tag in profile['tags']:
-                print(f"     - {tag['key']}: {tag['value']}")
+                parts.append(f"     - {tag['key']}: {tag['value']}\n")
+    sys.stdout.write("".join(parts))
 
-def get_inference_profiles(bedrock_tagger: BedrockTagger) -> list:
+def get_inference_profiles(bedrock_tagger: "BedrockTagger") -> list:
     """
     Args:
         bedrock_tagger: BedrockTaggers object
@@ -173,7 +306,10 @@ def get_inference_profiles(bedrock_tagger: BedrockTagger) -> list:
         list of inference profiles
     """
     while True:
-        profiles = bedrock_tagger.list_inference_profiles(type='SYSTEM_DEFINED')
+        profiles = cached_list(
+            ('profiles', bedrock_tagger.region_name, 'SYSTEM_DEFINED'),
+            lambda: bedrock_tagger.list_inference_profiles(type='SYSTEM_DEFINED')
+        )
         
         if profiles:
             display_inference_profiles(profiles)
@@ -181,52 +317,117 @@ def get_inference_profiles(bedrock_tagger: BedrockTagger) -> list:
         else:
             print("\nNo profiles found, Please try again.")
 
-def save_to_csv(profiles: list, tags: list, filename: str = None):
+def _session_ts() -> str:
+    """Local timestamp used in CSV result filenames"""
+    return time.strftime("%Y%m%d_%H%M%S")
+
+def format_tags(tags: list) -> str:
+    """Format tags as a single string for the CSV Tags column"""
+    return '; '.join([f"{tag['key']}={tag['value']}" for tag in tags or []])
+
+def _quote_csv_field(value: str) -> str:
+    """Quote a CSV field the way csv.QUOTE_MINIMAL would"""
+    if any(char in value for char in ',"\r\n'):
+        return '"' + value.replace('"', '""') + '"'
+    return value
+
+class CsvAppender:
     """
-    Save inference profiles and their tags to a CSV file.
-    
-    Args:
-        profiles: list of inference profile dictionaries
-        tags: list of tag dictionaries
-        filename: Optional specific filename to use, if None will generate with timestamp
+    Append inference profiles and their tags to a CSV file.
+
+    The file is opened once on the first append and kept open until the
+    context exits, so a whole session writes through a single handle.
     """
-    try:
+    header = b'Profile Name,Profile ARN,Tags\r\n'
+    # Unless flush_each_row is set, rows are only flushed when the buffer
+    # fills or the file is closed
+    buffer_size = 1024 * 1024
+    # Profile names and ARNs never contain commas, quotes or newlines, so
+    # only the user-supplied Tags field needs CSV quoting
+    row_format = '{},{},{}\r\n'.format
+
+    def __init__(self, filename: str = None, tags: list = None, report: Callable = print,
+                 report_error: Callable = None, flush_each_row: bool = False):
+        """
+        Args:
+            filename: Optional specific filename to use, if None will generate with timestamp
+            tags: list of tag dictionaries shared by every profile in the session
+            report: function used to show save results
+            report_error: function used to show errors, defaults to report
+            flush_each_row: write every row to disk immediately, for interactive
+                sessions where a lost buffer would drop already-created profiles
+        """
         # Use provided filename or create one with timestamp
         if not filename:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            filename = f"inference_profiles_{timestamp}.csv"
-        
-        # Format tags as a single string
-        tag_str = '; '.join([f"{tag['key']}={tag['value']}" for tag in tags])
-        
-        # Check if file exists to determine if we need to write header
-        file_exists = os.path.exists(filename)
-        
-        # Write to CSV in append mode
-        with open(filename, 'a', newline='') as csvfile:
-            fieldnames = ['Profile Name', 'Profile ARN', 'Tags']
-            writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-            
-            # Write header only if file is new
-            if not file_exists:
-                writer.writeheader()
-            
-            # Write new profiles
-            for profile in profiles:
-                writer.writerow({
-                    'Profile Name': profile['name'],
-                    'Profile ARN': profile['inferenceProfileArn'],
-                    'Tags': tag_str
-                })
-        
-        print(f"\n✅ Results saved to {filename}")
-        
-    except Exception as e:
-        print(f"\n❌ Error saving to CSV: {str(e)}")
+            filename = f"inference_profiles_{_session_ts()}.csv"
+        self.filename = filename
+        self.report = report
+        self.report_error = report_error or report
+        self.flush_each_row = flush_each_row
+        # Tags are the same for every row, so the Tags field is formatted once
+        self.tag_str = format_tags(tags)
+        self._tag_field = _quote_csv_field(self.tag_str)
+        self.count = 0
+        self._csvfile = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+        return False
+
+    def append(self, profile: dict):
+        """
+        Write a single profile row.
+
+        Args:
+            profile: inference profile dictionary with 'name' and 'inferenceProfileArn'
+        """
+        try:
+            if self._csvfile is None:
+                self._csvfile = open(self.filename, 'ab', buffering=self.buffer_size)
+
+                # Write header only if file is new, append mode starts at the end
+                if self._csvfile.tell() == 0:
+                    self._csvfile.write(self.header)
+
+            self._csvfile.write(self.row_format(
+                profile['name'],
+                profile['inferenceProfileArn'],
+                self._tag_field
+            ).encode('utf-8'))
+            if self.flush_each_row:
+                self._csvfile.flush()
+            self.count += 1
+
+        except Exception as e:
+            self.report_error(f"\n❌ Error saving to CSV: {str(e)}")
+
+    def close(self):
+        """Close the CSV file if it was opened"""
+        if self._csvfile is None:
+            return
+        try:
+            self._csvfile.close()
+            self.report(f"\n✅ Results saved to {self.filename}")
+        except Exception as e:
+            self.report_error(f"\n❌ Error saving to CSV: {str(e)}")
+        finally:
+            self._csvfile = None
+
+def load_yaml(stream):
+    """Safely load YAML, using the libyaml C loader when PyYAML was built with it"""
+    import yaml
+    try:
+        from yaml import CSafeLoader as Loader
+    except ImportError:
+        from yaml import SafeLoader as Loader
+    return yaml.load(stream, Loader=Loader)
 
 def interactive_create_inference_profile():
     # 1.List profiles and select profile or input AWS Credential Information
-    session = initBoto3Session()
+    session, client_config = initBoto3Session()
     region = get_user_input("Enter Region", "ap-northeast-1")
 
     # 2. Set tag information
@@ -234,84 +435,89 @@ def interactive_create_inference_profile():
     tags = get_tags_input()
 
     # 3. Create a session-specific filename
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    session_filename = f"inference_profiles_{timestamp}.csv"
+    session_filename = f"inference_profiles_{_session_ts()}.csv"
 
     # 4. Initialize BedrockTagger 
-    bedrock_tagger = BedrockTagger(session, region)
+    from bedrock_tagger import BedrockTagger
+    bedrock_tagger = BedrockTagger(session, region, client_config)
 
     # 5. Create Inference Profile
-    while True:
-        try:
-            print("\n=== Create Application Inference Profile ===")
+    # A person sets the pace here, so rows are flushed as soon as they are written
+    with CsvAppender(session_filename, tags, flush_each_row=True) as csv_appender:
+        while True:
+            try:
+                print("\n=== Create Application Inference Profile ===")
             
-            profile_name = get_user_input("Enter Inference Profile Name")
-            type = get_user_input("Select Model Type: Foundation Model<1> or Inference Profile<2>", "1")
-            model_arn =""
-            if type == "1":
-                # Add model listing functionality with retry logic
-                print("\n=== List Available Models ===")
-                models = get_valid_models(bedrock_tagger)
-                selected_model = None
-                while True:
-                    try:
-                        model_index = int(get_user_input("Select model index"))
-                        if 0 <= model_index < len(models):
-                            selected_model = models[model_index]
-                            break
-                        else:
-                            print(f"Please enter a valid index between 0 and {len(models)-1}")
-                    except ValueError:
-                        print("Please enter a valid number")
+                profile_name = get_user_input("Enter Inference Profile Name")
+                type = get_user_input("Select Model Type: Foundation Model<1> or Inference Profile<2>", "1")
+                model_arn =""
+                if type == "1":
+                    # Add model listing functionality with retry logic
+                    print("\n=== List Available Models ===")
+                    models = get_valid_models(bedrock_tagger)
+                    selected_model = None
+                    while True:
+                        try:
+                            model_index = int(get_user_input("Select model index"))
+                            if 0 <= model_index < len(models):
+                                selected_model = models[model_index]
+                                break
+                            else:
+                                print(f"Please enter a valid index between 0 and {len(models)-1}")
+                        except ValueError:
+                            print("Please enter a valid number")
                 
-                model_arn = f"arn:aws:bedrock:{region}::foundation-model/{selected_model['modelId']}"
-                print(f"Selected model ARN: {model_arn}")
-
-            else:
-                print("\n=== List Inference Profiles ===")
-                profiles = get_inference_profiles(bedrock_tagger)
-                selected_profile = None
-                while True:
-                    try:
-                        profile_index = int(get_user_input("Select profile index"))
-                        if 0 <= profile_index < len(profiles):
-                            selected_profile = profiles[profile_index]
-                            break
-                        else:
-                            print(f"Please enter a valid index between 0 and {len(profiles)-1}")
-                    except ValueError:
-                        print("Please enter a valid number")
+                    model_arn = f"arn:aws:bedrock:{region}::foundation-model/{selected_model['modelId']}"
+                    print(f"Selected model ARN: {model_arn}")
+
+                else:
+                    print("\n=== List Inference Profiles ===")
+                    profiles = get_inference_profiles(bedrock_tagger)
+                    selected_profile = None
+                    while True:
+                        try:
+                            profile_index = int(get_user_input("Select profile index"))
+                            if 0 <= profile_index < len(profiles):
+                                selected_profile = profiles[profile_index]
+                                break
+                            else:
+                                print(f"Please enter a valid index between 0 and {len(profiles)-1}")
+                        except ValueError:
+                            print("Please enter a valid number")
                 
-                model_arn = selected_profile['inferenceProfileArn']
-                print(f"Selected profile ARN: {model_arn}")
-
-            # Start to Create Inference Profile
-            print("\nCreating Inference Profile...")
-            response = bedrock_tagger.create_inference_profile(profile_name, model_arn, tags)
-            print(f"\n✅ Your Application Inference Profile Creation Succeeded, ARN: {response['inferenceProfileArn']}")
-
-            # Save each successful creation immediately
-            new_profile = {
-                'name': profile_name,
-                'inferenceProfileArn': response['inferenceProfileArn']
-            }
-            save_to_csv([new_profile], tags, filename=session_filename)
+                    model_arn = selected_profile['inferenceProfileArn']
+                    print(f"Selected profile ARN: {model_arn}")
 
-            # Ask if user want to continue creating.
-            if get_user_input("\nContinue to create another Inference Profile?(y/n)", "n").lower() != 'y':
-                print("\n Thanks for using!")
-                break
+                # Start to Create Inference Profile
+                print("\nCreating Inference Profile...")
+                # Throttling and network errors are already retried by the client's
+                # adaptive retry mode, the user is only asked to retry after that
+                response = bedrock_tagger.create_inference_profile(profile_name, model_arn, tags)
+                print(f"\n✅ Your Application Inference Profile Creation Succeeded, ARN: {response['inferenceProfileArn']}")
 
-        except Exception as e:
-            print(f"\n❌ ERROR: {str(e)}")
-            if get_user_input("\nRetry?(y/n)", "y").lower() != 'y':
-                print("\n Thanks for using!")
-                break
+                # Save each successful creation immediately
+                new_profile = {
+                    'name': profile_name,
+                    'inferenceProfileArn': response['inferenceProfileArn']
+                }
+                csv_appender.append(new_profile)
+
+                # Ask if user want to continue creating.
+                if get_user_input("\nContinue to create another Inference Profile?(y/n)", "n").lower() != 'y':
+                    print("\n Thanks for using!")
+                    break
+
+            except Exception as e:
+                print(f"\n❌ ERROR: {str(e)}")
+                if get_user_input("\nRetry?(y/n)", "y").lower() != 'y':
+                    print("\n Thanks for using!")
+                    break
 
 def interactive_list_inference_profile():
-    session = initBoto3Session()
+    session, client_config = initBoto3Session()
     region = get_user_input("Enter Region", "ap-northeast-1")
-    bedrock_tagger = BedrockTagger(session, region)
+    from bedrock_tagger import BedrockTagger
+    bedrock_tagger = BedrockTagger(session, region, client_config)
 
     # List application inference profiles
     print("\nListing Application inference profiles...")
@@ -336,192 +542,294 @@ def interactive_list_inference_profile():
             except ValueError:
                 print("Please enter a valid number")
 
-def batch_create_inference_profiles(config_file):
+# A validated 'bedrock-profiles' entry, with its model ARN already resolved
+ProfileSpec = namedtuple('ProfileSpec', 'name model_id model_arn')
+
+def _validate_batch_config(config: dict, region: str, include_existing: bool = False) -> list:
+    """
+    Validate the profile entries of a batch configuration in one pass.
+
+    Args:
+        config: loaded YAML configuration
+        region: region used to build foundation model ARNs
+        include_existing: also check the 'existing-profiles-to-tag' entries
+
+    Returns:
+        list of ProfileSpec for the 'bedrock-profiles' entries
+
+    Raises:
+        ValueError: listing every invalid entry
+    """
+    errors = []
+    specs = []
+
+    for idx, profile_config in enumerate(config.get('bedrock-profiles') or []):
+        if not isinstance(profile_config, dict):
+            errors.append(f"bedrock-profiles[{idx}]: expected a mapping")
+            continue
+        profile_name = profile_config.get('name')
+        model_type = profile_config.get('model_type')
+        model_id = profile_config.get('model_id')
+
+        if not profile_name:
+            errors.append(f"bedrock-profiles[{idx}]: missing 'name'")
+        if not model_id:
+            errors.append(f"bedrock-profiles[{idx}]: missing 'model_id'")
+
+        # Construct model ARN based on type
+        if model_type == "foundation":
+            model_arn = f"arn:aws:bedrock:{region}::foundation-model/{model_id}"
+        elif model_type == "inference":
+            # Assume model_id is already a full ARN for inference profiles
+            model_arn = model_id
+        else:
+            errors.append(f"bedrock-profiles[{idx}]: 'model_type' must be 'foundation' or 'inference'")
+            continue
+        specs.append(ProfileSpec(profile_name, model_id, model_arn))
+
+    if include_existing:
+        for idx, profile_config in enumerate(config.get('existing-profiles-to-tag') or []):
+            if not isinstance(profile_config, dict) or not (profile_config.get('name') or profile_config.get('arn')):
+                errors.append(f"existing-profiles-to-tag[{idx}]: profile must have either 'name' or 'arn' specified")
+
+    if errors:
+        raise ValueError("\n".join(f"   - {error}" for error in errors))
+    return specs
+
+def create_profile_from_spec(bedrock_tagger: "BedrockTagger", spec: ProfileSpec, tags: list) -> dict:
+    """
+    Create one inference profile from a validated ProfileSpec.
+
+    Args:
+        bedrock_tagger: BedrockTagger object
+        spec: ProfileSpec returned by _validate_batch_config()
+        tags: list of tag dictionaries
+
+    Returns:
+        dict with the created profile's 'name' and 'inferenceProfileArn'
+    """
+    # Logged from the worker so each line sits next to this profile's result
+    log.info(f"\nThe processing model is: {spec.model_id}...")
+    log.info(f"Creating Inference Profile with model ARN: {spec.model_arn}")
+    response = bedrock_tagger.create_inference_profile(spec.name, spec.model_arn, tags)
+    return {
+        'name': spec.name,
+        'inferenceProfileArn': response['inferenceProfileArn']
+    }
+
+def tag_existing_profile(bedrock_tagger: "BedrockTagger", profile_config: dict, tags: list,
+                         by_name: dict, by_arn: dict) -> dict:
+    """
+    Tag one profile described by an 'existing-profiles-to-tag' entry.
+
+    Args:
+        bedrock_tagger: BedrockTagger object
+        profile_config: entry with 'name' or 'arn', checked by _validate_batch_config()
+        tags: list of tag dictionaries
+        by_name: application profiles listed up front, keyed by name
+        by_arn: the same profiles keyed by ARN
+
+    Returns:
+        dict with the tagged profile's 'name' and 'inferenceProfileArn', or None on failure
+    """
+    profile_name = profile_config.get('name')
+    profile_arn = profile_config.get('arn')
+
+    # Find profile by name if ARN not provided. The up-front listing may be
+    # incomplete if a page failed, so a miss falls back to a fresh lookup;
+    # it skips the per-profile tag calls since only the name and ARN are used.
+    if not profile_arn:
+        log.info(f"🔍 Finding profile by name: {profile_name}")
+        profile = by_name.get(profile_name) or \
+            bedrock_tagger.find_inference_profile_by_name(profile_name, include_tags=False)
+        if not profile:
+            log.error(f"❌ Profile not found: {profile_name}")
+            return None
+        profile_arn = profile['inferenceProfileArn']
+        profile_name = profile['name']
+    elif profile_arn in by_arn:
+        profile_name = by_arn[profile_arn]['name']
+    else:
+        # Not in the up-front listing, get profile details by ARN
+        profile_details = bedrock_tagger.get_inference_profile_by_arn(profile_arn)
+        if not profile_details:
+            log.error(f"❌ Profile not found: {profile_arn}")
+            return None
+        profile_name = profile_details.get('inferenceProfileName', 'Unknown')
+
+    log.info(f"🏷️  Tagging profile: {profile_name} ({profile_arn})")
+
+    # Tag the profile
+    if not bedrock_tagger.tag_inference_profile(profile_arn, tags):
+        log.error(f"❌ Failed to tag profile: {profile_name}")
+        return None
+
+    log.info(f"✅ Successfully tagged profile: {profile_name}")
+    return {
+        'name': profile_name,
+        'inferenceProfileArn': profile_arn
+    }
+
+@contextmanager
+def cancel_pending_on_interrupt(executor: ThreadPoolExecutor):
+    """
+    Cancel queued work when the batch loop is interrupted (e.g. Ctrl+C).
+
+    Without this the executor's exit would wait for every submitted profile,
+    so an interrupted batch would keep creating resources. Only the calls
+    already running are waited for.
+    """
+    try:
+        yield
+    except BaseException:
+        executor.shutdown(wait=True, cancel_futures=True)
+        raise
+
+def batch_create_inference_profiles(config_file, max_workers: int = 8):
     # Determine file type (YAML or JSON) and load accordingly
     if config_file.endswith('.yaml') or config_file.endswith('.yml'):
         with open(config_file, 'r') as f:
-            config = yaml.safe_load(f)
+            config = load_yaml(f)
     else:
-        print(f"❌ Unsupported file format: {config_file}")
+        log.error(f"❌ Unsupported file format: {config_file}")
         return
     
     # Initialize session (may need to modify to support non-interactive credential selection)
-    session = initBoto3Session()
+    session, client_config = initBoto3Session(max_workers)
     region = config.get('region')
     if not region:
         region = get_user_input("Enter Region", "ap-northeast-1")
 
     tags = config.get('tags')
 
-    # Initialize BedrockTagger
-    bedrock_tagger = BedrockTagger(session, region)
+    # Validate every profile before making any Bedrock call
+    try:
+        profile_specs = _validate_batch_config(config, region)
+    except ValueError as e:
+        log.error(f"❌ Invalid configuration file {config_file}:\n{str(e)}")
+        return
+
+    # Initialize BedrockTagger, its client is shared by all worker threads
+    from bedrock_tagger import BedrockTagger
+    bedrock_tagger = BedrockTagger(session, region, client_config, report=log.info, report_error=log.error)
 
     # Create CSV file for results
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    session_filename = f"inference_profiles_{timestamp}.csv"
+    session_filename = f"inference_profiles_{_session_ts()}.csv"
     
-    # Process each profile
-    for profile_config in config.get('bedrock-profiles', []):
-        try:
-            profile_name = profile_config.get('name')
-            model_type = profile_config.get('model_type')
-            model_id = profile_config.get('model_id')
-
-            print(f"\nThe processing model is: {model_id}...")
-            # Construct model ARN based on type
-            model_arn = ""
-            if model_type == "foundation":
-                model_arn = f"arn:aws:bedrock:{region}::foundation-model/{model_id}"
-            elif model_type == "inference":
-                # Assume model_id is already a full ARN for inference profiles
-                model_arn = model_id
-            
-            print(f"Creating Inference Profile with model ARN: {model_arn}")
-            response = bedrock_tagger.create_inference_profile(profile_name, model_arn, tags)
-            print(f"✅ Inference Profile created: {response['inferenceProfileArn']}")
-
-            # Save to CSV
-            new_profile = {
-                'name': profile_name,
-                'inferenceProfileArn': response['inferenceProfileArn']
-            }
-            save_to_csv([new_profile], tags, filename=session_filename)
-            
-        except Exception as e:
-            print(f"❌ Error creating profile {profile_name}: {str(e)}")
-            continue
+    # Process profiles concurrently, saving each result as it completes
+    with CsvAppender(session_filename, tags, report=log.info, report_error=log.error) as csv_appender, \
+            ThreadPoolExecutor(max_workers=max_workers) as executor, \
+            cancel_pending_on_interrupt(executor):
+        futures = {
+            executor.submit(create_profile_from_spec, bedrock_tagger, spec, tags): spec.name
+            for spec in profile_specs
+        }
+
+        for future in as_completed(futures):
+            profile_name = futures[future]
+            try:
+                new_profile = future.result()
+                log.info(f"✅ Inference Profile created: {new_profile['inferenceProfileArn']}")
+
+                # Save to CSV
+                csv_appender.append(new_profile)
+
+            except Exception as e:
+                log.error(f"❌ Error creating profile {profile_name}: {str(e)}")
 
-def batch_tag_inference_profiles(config_file):
+def batch_tag_inference_profiles(config_file, max_workers: int = 8):
     """
     Batch tag existing inference profiles from a YAML configuration file
     
     Args:
         config_file: Path to the YAML configuration file
+        max_workers: Number of profiles processed concurrently
     """
     # Load configuration file
     if config_file.endswith('.yaml') or config_file.endswith('.yml'):
         with open(config_file, 'r') as f:
-            config = yaml.safe_load(f)
+            config = load_yaml(f)
     else:
-        print(f"❌ Unsupported file format: {config_file}")
+        log.error(f"❌ Unsupported file format: {config_file}")
         return
     
     # Initialize session
-    session = initBoto3Session()
+    session, client_config = initBoto3Session(max_workers)
     region = config.get('region')
     if not region:
         region = get_user_input("Enter Region", "ap-northeast-1")
 
     tags = config.get('tags')
     if not tags:
-        print("❌ No tags found in configuration file")
+        log.error("❌ No tags found in configuration file")
         return
 
-    # Initialize BedrockTagger
-    bedrock_tagger = BedrockTagger(session, region)
+    # Validate every profile before making any Bedrock call
+    try:
+        profiles_to_create = _validate_batch_config(config, region, include_existing=True)
+    except ValueError as e:
+        log.error(f"❌ Invalid configuration file {config_file}:\n{str(e)}")
+        return
+
+    # Initialize BedrockTagger, its client is shared by all worker threads
+    from bedrock_tagger import BedrockTagger
+    bedrock_tagger = BedrockTagger(session, region, client_config, report=log.info, report_error=log.error)
 
     # Create CSV file for results
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    session_filename = f"tagged_profiles_{timestamp}.csv"
+    session_filename = f"tagged_profiles_{_session_ts()}.csv"
     
     # Check if we have existing profiles to tag or profiles to create and tag
-    existing_profiles_to_tag = config.get('existing-profiles-to-tag', [])
-    profiles_to_create = config.get('bedrock-profiles', [])
-    
-    tagged_profiles = []
-    
-    # Tag existing profiles
-    if existing_profiles_to_tag:
-        print(f"\n=== Tagging {len(existing_profiles_to_tag)} existing profiles ===")
-        for profile_config in existing_profiles_to_tag:
-            try:
-                profile_name = profile_config.get('name')
-                profile_arn = profile_config.get('arn')
-                
-                if not profile_name and not profile_arn:
-                    print("❌ Profile must have either 'name' or 'arn' specified")
-                    continue
-                
-                # Find profile by name if ARN not provided
-                if not profile_arn:
-                    print(f"🔍 Finding profile by name: {profile_name}")
-                    profile = bedrock_tagger.find_inference_profile_by_name(profile_name)
-                    if not profile:
-                        print(f"❌ Profile not found: {profile_name}")
-                        continue
-                    profile_arn = profile['inferenceProfileArn']
-                    profile_name = profile['name']
-                else:
-                    # Get profile details by ARN
-                    profile_details = bedrock_tagger.get_inference_profile_by_arn(profile_arn)
-                    if not profile_details:
-                        print(f"❌ Profile not found: {profile_arn}")
-                        continue
-                    profile_name = profile_details.get('inferenceProfileName', 'Unknown')
-
-                print(f"🏷️  Tagging profile: {profile_name} ({profile_arn})")
-                
-                # Tag the profile
-                success = bedrock_tagger.tag_inference_profile(profile_arn, tags)
-                if success:
-                    print(f"✅ Successfully tagged profile: {profile_name}")
-                    tagged_profiles.append({
-                        'name': profile_name,
-                        'inferenceProfileArn': profile_arn
-                    })
-                else:
-                    print(f"❌ Failed to tag profile: {profile_name}")
-                    
-            except Exception as e:
-                print(f"❌ Error processing profile {profile_config}: {str(e)}")
-                continue
+    existing_profiles_to_tag = config.get('existing-profiles-to-tag') or []
     
-    # Create and tag new profiles (existing functionality)
-    if profiles_to_create:
-        print(f"\n=== Creating and tagging {len(profiles_to_create)} new profiles ===")
-        for profile_config in profiles_to_create:
-            try:
-                profile_name = profile_config.get('name')
-                model_type = profile_config.get('model_type')
-                model_id = profile_config.get('model_id')
-
-                print(f"🔨 Creating profile: {profile_name} with model: {model_id}")
-                
-                # Construct model ARN based on type
-                model_arn = ""
-                if model_type == "foundation":
-                    model_arn = f"arn:aws:bedrock:{region}::foundation-model/{model_id}"
-                elif model_type == "inference":
-                    model_arn = model_id
-                
-                response = bedrock_tagger.create_inference_profile(profile_name, model_arn, tags)
-                print(f"✅ Inference Profile created and tagged: {response['inferenceProfileArn']}")
-
-                tagged_profiles.append({
-                    'name': profile_name,
-                    'inferenceProfileArn': response['inferenceProfileArn']
-                })
-                
-            except Exception as e:
-                print(f"❌ Error creating profile {profile_name}: {str(e)}")
-                continue
+    # Results are streamed to CSV as each profile is tagged, the count is kept
+    # separately so a CSV failure doesn't hide profiles tagged in AWS
+    tagged_count = 0
+    with CsvAppender(session_filename, tags, report=log.info, report_error=log.error) as csv_appender, \
+            ThreadPoolExecutor(max_workers=max_workers) as executor, \
+            cancel_pending_on_interrupt(executor):
+        # Tag existing profiles
+        if existing_profiles_to_tag:
+            log.info(f"\n=== Tagging {len(existing_profiles_to_tag)} existing profiles ===")
+            # One listing answers every name/ARN lookup instead of a call per entry
+            all_profiles = bedrock_tagger.list_inference_profiles(type='APPLICATION', include_tags=False)
+            by_name = {profile['name']: profile for profile in all_profiles}
+            by_arn = {profile['inferenceProfileArn']: profile for profile in all_profiles}
+            futures = {
+                executor.submit(tag_existing_profile, bedrock_tagger, profile_config, tags, by_name, by_arn): profile_config
+                for profile_config in existing_profiles_to_tag
+            }
+            for future in as_completed(futures):
+                try:
+                    tagged_profile = future.result()
+                    if tagged_profile:
+                        tagged_count += 1
+                        csv_appender.append(tagged_profile)
+                except Exception as e:
+                    log.error(f"❌ Error processing profile {futures[future]}: {str(e)}")
     
-    # Save results to CSV
-    if tagged_profiles:
-        save_to_csv(tagged_profiles, tags, filename=session_filename)
-        print(f"\n📊 Tagged {len(tagged_profiles)} profiles successfully")
+        # Create and tag new profiles (existing functionality)
+        if profiles_to_create:
+            log.info(f"\n=== Creating and tagging {len(profiles_to_create)} new profiles ===")
+            futures = {}
+            for spec in profiles_to_create:
+                log.info(f"🔨 Creating profile: {spec.name} with model: {spec.model_id}")
+                futures[executor.submit(create_profile_from_spec, bedrock_tagger, spec, tags)] = spec.name
+
+            for future in as_completed(futures):
+                try:
+                    new_profile = future.result()
+                    log.info(f"✅ Inference Profile created and tagged: {new_profile['inferenceProfileArn']}")
+                    tagged_count += 1
+                    csv_appender.append(new_profile)
+                except Exception as e:
+                    log.error(f"❌ Error creating profile {futures[future]}: {str(e)}")
+
+    if tagged_count:
+        log.info(f"\n📊 Tagged {tagged_count} profiles successfully")
     else:
-        print("\n⚠️  No profiles were tagged")
+        log.warning("\n⚠️  No profiles were tagged")
 
 if __name__ == "__main__":
     """Main function to handle different commands"""
     args = parse_arguments()
-
-    if args.file:
-        batch_create_inference_profiles(args.file)
-    elif args.tag:
-        batch_tag_inference_profiles(args.tag)
-    elif args.list:
-        interactive_list_inference_profile()
-    else:
-        interactive_create_inference_profile()
\ No newline at end of file
+    args.func(args)
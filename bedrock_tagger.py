@@ -1,12 +1,18 @@
 import os
 
 class BedrockTagger:
-    def __init__(self, session=None, region_name=None):
+    def __init__(self, session=None, region_name=None, config=None, report=print, report_error=None):
         self.region_name = region_name
+        # Used for every message, so callers that buffer their output
+        # (e.g. through logging) keep these messages in order.
+        # Errors go to report_error, or to report when it isn't given.
+        self.report = report
+        self.report_error = report_error or report
         if not session:
             raise ValueError("Session must be provided when initializing BedrockTagger")
 
-        self.bedrock_client = session.client("bedrock", region_name=self.region_name)
+        # boto3 clients are thread-safe, so one client is shared by all callers
+        self.bedrock_client = session.client("bedrock", region_name=self.region_name, config=config)
 
     def create_inference_profile(self, profile_name, model_arn, tags):    
         """Create Inference Profile using base model ARN"""
@@ -54,10 +60,10 @@ class BedrockTagger:
         """
         try:
             self.bedrock_client.delete_inference_profile(inferenceProfileIdentifier=profile_arn)
-            print(f"\n✅ Successfully deleted inference profile: {profile_arn}")
+            self.report(f"\n✅ Successfully deleted inference profile: {profile_arn}")
             return True
         except Exception as e:
-            print(f"\n❌ Error deleting profile: {str(e)}")
+            self.report_error(f"\n❌ Error deleting profile: {str(e)}")
             return False
 
     def list_available_models(self, keyword: str = None) -> list:
@@ -90,12 +96,16 @@ class BedrockTagger:
             
             return models
         except Exception as e:
-            print(f"Error listing models: {str(e)}")
+            self.report_error(f"Error listing models: {str(e)}")
             return []
 
-    def list_inference_profiles(self, type: str = None) -> list:
+    def list_inference_profiles(self, type: str = None, include_tags: bool = True) -> list:
         """
         List all application inference profiles in current region.
+
+        Args:
+            type: Optional profile type ('APPLICATION' or 'SYSTEM_DEFINED')
+            include_tags: Look up each profile's tags, which costs one extra call per profile
             
         Returns:
             list of dictionaries containing profile information
@@ -108,13 +118,15 @@ class BedrockTagger:
             for page in paginator.paginate(typeEquals=type):
                 for profile in page.get('inferenceProfileSummaries', []):
                     # Get tags for each profile
-                    try:
-                        tags_response = self.bedrock_client.list_tags_for_resource(
-                            resourceARN=profile.get('inferenceProfileArn')
-                        )
-                        tags = tags_response.get('tags', [])
-                    except Exception as e:
-                        tags = []
+                    tags = []
+                    if include_tags:
+                        try:
+                            tags_response = self.bedrock_client.list_tags_for_resource(
+                                resourceARN=profile.get('inferenceProfileArn')
+                            )
+                            tags = tags_response.get('tags', [])
+                        except Exception as e:
+                            tags = []
 
                     profiles.append({
                         'region': self.region_name,
@@ -127,7 +139,7 @@ class BedrockTagger:
                     })
 
         except Exception as e:
-            print(f"Error listing profiles in region {self.region_name}: {str(e)}")
+            self.report_error(f"Error listing profiles in region {self.region_name}: {str(e)}")
         return profiles
 
     def tag_inference_profile(self, profile_arn: str, tags: list) -> bool:
@@ -151,7 +163,7 @@ class BedrockTagger:
             )
             return True
         except Exception as e:
-            print(f"❌ Error tagging profile {profile_arn}: {str(e)}")
+            self.report_error(f"❌ Error tagging profile {profile_arn}: {str(e)}")
             return False
 
     def get_inference_profile_by_arn(self, profile_arn: str):
@@ -170,26 +182,28 @@ class BedrockTagger:
             )
             return response
         except Exception as e:
-            print(f"❌ Error getting profile {profile_arn}: {str(e)}")
+            self.report_error(f"❌ Error getting profile {profile_arn}: {str(e)}")
             return None
 
-    def find_inference_profile_by_name(self, profile_name: str, profile_type: str = 'APPLICATION'):
+    def find_inference_profile_by_name(self, profile_name: str, profile_type: str = 'APPLICATION',
+                                       include_tags: bool = True):
         """
         Find inference profile by name
         
         Args:
             profile_name: Name of the inference profile to find
             profile_type: Type of profile ('APPLICATION' or 'SYSTEM_DEFINED')
+            include_tags: Look up the tags of every listed profile
             
         Returns:
             dict: Profile information or None if not found
         """
         try:
-            profiles = self.list_inference_profiles(type=profile_type)
+            profiles = self.list_inference_profiles(type=profile_type, include_tags=include_tags)
             for profile in profiles:
                 if profile['name'] == profile_name:
                     return profile
             return None
         except Exception as e:
-            print(f"❌ Error finding profile {profile_name}: {str(e)}")
+            self.report_error(f"❌ Error finding profile {profile_name}: {str(e)}")
             return None       
\ No newline at end of file